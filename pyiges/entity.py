@@ -34,6 +34,8 @@ class Entity:
     0
     """
 
+    __slots__ = ("d", "parameters", "iges", "sequence_number")
+
     def __init__(self, iges):
         self.d = dict()
         self.parameters = []
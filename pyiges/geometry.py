@@ -1,3 +1,4 @@
+import functools
 import os
 
 import numpy as np
@@ -5,6 +6,10 @@ import numpy as np
 from pyiges.check_imports import assert_full_module_variant, pyvista as pv
 from pyiges.entity import Entity
 
+# Keep the raw parameter strings on entities that parse them into fields.
+# Only useful for debugging, as it holds every parameter string in memory.
+KEEP_RAW_PARAMETERS = False
+
 
 def parse_float(str_value):
     """
@@ -18,37 +23,172 @@ def parse_float(str_value):
         return float(str_value.lower().replace("d", "e"))
 
 
+def parse_floats(str_values):
+    """
+    Convert a sequence of strings to a ``numpy`` array of floats in a
+    single pass. Like ``parse_float``, numbers such as 1.2D3 are
+    supported.
+    """
+    # Scanning for 'D' exponents up front is cheap compared to a failed
+    # conversion, and only the (uncommon) files using them are rewritten
+    text = "\n".join(str_values)
+    if "D" in text or "d" in text:
+        str_values = text.replace("D", "E").replace("d", "e").split("\n")
+    return np.array(str_values, dtype=np.float64)
+
+
+def _apply_schema(entity, parameters, schema):
+    """
+    Set the attributes of an entity with a fixed parameter layout.
+    ``schema`` is a sequence of ``(name, converter)`` pairs for the
+    parameters following the entity type number.
+    """
+    if len(parameters) <= len(schema):
+        raise ValueError(
+            f"Expected {len(schema)} parameters, got {len(parameters) - 1}"
+        )
+    for (name, converter), value in zip(schema, parameters[1:]):
+        setattr(entity, name, converter(value))
+
+
+def _bspline_basis(degree, knots, n_ctrl, params):
+    """
+    Evaluate all B-spline basis functions of a knot vector at the
+    given parameter values (The NURBS Book, Algorithm A2.2). Returns
+    a dense ``(len(params), n_ctrl)`` matrix.
+    """
+    knots = np.asarray(knots, dtype=np.float64)
+    params = np.asarray(params, dtype=np.float64)
+    n_params = params.size
+
+    # knot span of each parameter, clamped to the valid range
+    spans = np.searchsorted(knots, params, side="right") - 1
+    spans = np.clip(spans, degree, n_ctrl - 1)
+
+    # non-zero basis functions of each span, computed for all
+    # parameters at once
+    basis = np.zeros((n_params, degree + 1))
+    basis[:, 0] = 1.0
+    left = np.empty((n_params, degree + 1))
+    right = np.empty((n_params, degree + 1))
+    for j in range(1, degree + 1):
+        left[:, j] = params - knots[spans + 1 - j]
+        right[:, j] = knots[spans + j] - params
+        saved = 0.0
+        for r in range(j):
+            temp = basis[:, r] / (right[:, r + 1] + left[:, j - r])
+            basis[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        basis[:, j] = saved
+
+    dense = np.zeros((n_params, n_ctrl))
+    cols = spans[:, np.newaxis] - degree + np.arange(degree + 1)
+    dense[np.arange(n_params)[:, np.newaxis], cols] = basis
+    return dense
+
+
+@functools.lru_cache(maxsize=256)
+def _sampled_bspline_basis(degree, knots, n_samples):
+    """
+    Basis matrix of a knot vector (given as a tuple) sampled at
+    ``n_samples`` evenly spaced parameters over its valid range.
+
+    Surfaces within a file frequently share knot vectors, so the
+    matrices are cached and returned read-only.
+    """
+    knots = np.array(knots)
+    params = np.linspace(knots[degree], knots[-(degree + 1)], n_samples)
+    basis = _bspline_basis(degree, knots, knots.size - degree - 1, params)
+    basis.setflags(write=False)
+    return basis
+
+
+def _parse_loop(values, n_edges):
+    """
+    Split the parameters of a Loop (Type 508) into integer tables.
+
+    ``values`` are all parameters of the entity as integers.  Returns
+    an ``(n_edges, 5)`` array with the columns type, e1, index1, flag1
+    and k1, the ``n_edges + 1`` curve offsets, and a ``(total_k1, 2)``
+    array with the iso and psc columns of all parameter space curves,
+    where ``curves[offsets[i]:offsets[i + 1]]`` belong to edge ``i``.
+    """
+    if n_edges and len(values) > 6:
+        uniform = _parse_uniform_loop(values, n_edges, int(values[6]))
+        if uniform is not None:
+            return uniform
+
+    # First pass: each edge takes 5 + 2*K1 parameters, so the K1 counts
+    # are read one at a time to find where every edge starts
+    k1 = np.empty(n_edges, dtype=np.int64)
+    c = 2
+    for i in range(n_edges):
+        k1[i] = values[c + 4]
+        c += 5 + 2 * int(k1[i])
+    curve_offsets = np.zeros(n_edges + 1, dtype=np.int64)
+    np.cumsum(k1, out=curve_offsets[1:])
+    starts = 2 + 5 * np.arange(n_edges) + 2 * curve_offsets[:-1]
+
+    # Second pass: gather the columns of both tables
+    edges = values[starts[:, np.newaxis] + np.arange(5)]
+    pairs = np.arange(curve_offsets[-1]) - np.repeat(curve_offsets[:-1], k1)
+    iso_index = np.repeat(starts + 5, k1) + 2 * pairs
+    curves = np.column_stack((values[iso_index], values[iso_index + 1]))
+    return edges, curve_offsets, curves
+
+
+def _parse_uniform_loop(values, n_edges, k1):
+    """
+    Fast path of ``_parse_loop`` for loops in which every edge has the
+    same number ``k1`` of parameter space curves, as is usually the
+    case.  The records then have a fixed stride and are reshaped
+    instead of scanned.  Returns ``None`` when the records differ.
+    """
+    stride = 5 + 2 * k1
+    if len(values) < 2 + n_edges * stride:
+        return None
+    records = values[2 : 2 + n_edges * stride].reshape(n_edges, stride)
+    # each edge only starts where assumed if all previous ones have k1
+    if not (records[:, 4] == k1).all():
+        return None
+
+    curve_offsets = k1 * np.arange(n_edges + 1)
+    return records[:, :5].copy(), curve_offsets, records[:, 5:].reshape(-1, 2)
+
+
 class Point(Entity):
     """IGES Point"""
 
+    __slots__ = ("_xyz",)
+
     def _add_parameters(self, parameters):
-        self._x = parse_float(parameters[1])
-        self._y = parse_float(parameters[2])
-        self._z = parse_float(parameters[3])
+        self._xyz = parse_floats(parameters[1:4])
+        # coordinate is handed out without copying
+        self._xyz.setflags(write=False)
 
     @property
     def x(self):
         """X coordinate"""
-        return self._x
+        return self._xyz[0]
 
     @property
     def y(self):
         """Y coordinate"""
-        return self._y
+        return self._xyz[1]
 
     @property
     def z(self):
         """Z coordinate"""
-        return self._z
+        return self._xyz[2]
 
     @property
     def coordinate(self):
-        """Coordinate of the point as a numpy array"""
-        return np.array([self._x, self._y, self._z])
+        """Coordinate of the point as a read-only numpy array"""
+        return self._xyz
 
     def __repr__(self):
         s = "--- IGES Point ---" + os.linesep
-        s += f"{self._x}, {self._y}, {self._z} {os.linesep}"
+        s += f"{self.x}, {self.y}, {self.z} {os.linesep}"
         return s
 
     def __str__(self):
@@ -69,26 +209,26 @@ class Point(Entity):
 class Line(Entity):
     """IGES Straight line segment"""
 
+    __slots__ = ("_coordinates",)
+
     def _add_parameters(self, parameters):
-        self._x1 = parse_float(parameters[1])
-        self._y1 = parse_float(parameters[2])
-        self._z1 = parse_float(parameters[3])
-        self._x2 = parse_float(parameters[4])
-        self._y2 = parse_float(parameters[5])
-        self._z2 = parse_float(parameters[6])
+        self._coordinates = parse_floats(parameters[1:7]).reshape(2, 3)
+        # coordinates are handed out without copying
+        self._coordinates.setflags(write=False)
 
     @property
     def coordinates(self):
-        """Starting and ending point of the line as a ``numpy`` array"""
-        return np.array(
-            [[self._x1, self._y1, self._z1], [self._x2, self._y2, self._z2]]
-        )
+        """Starting and ending point of the line as a read-only
+        ``numpy`` array"""
+        return self._coordinates
 
     def __repr__(self):
+        x1, y1, z1 = self._coordinates[0]
+        x2, y2, z2 = self._coordinates[1]
         s = "--- IGES Line ---" + os.linesep
         s += Entity.__str__(self) + os.linesep
-        s += f"From point {self._x1}, {self._y1}, {self._z1} {os.linesep}"
-        s += f"To point {self._x2}, {self._y2}, {self._z2}"
+        s += f"From point {x1}, {y1}, {z1} {os.linesep}"
+        s += f"To point {x2}, {y2}, {z2}"
         return s
 
     @assert_full_module_variant
@@ -100,9 +240,7 @@ class Line(Entity):
         mesh : ``pyvista.PolyData``
             ``pyvista`` mesh
         """
-        return pv.Line(
-            [self._x1, self._y1, self._z1], [self._x2, self._y2, self._z2], resolution
-        )
+        return pv.Line(self._coordinates[0], self._coordinates[1], resolution)
 
 
 class Transformation(Entity):
@@ -119,6 +257,8 @@ class Transformation(Entity):
 
     """
 
+    __slots__ = ("_affine",)
+
     def _add_parameters(self, parameters):
         """
         Index in list	Type of data	Name	Description
@@ -131,34 +271,79 @@ class Transformation(Entity):
         12	REAL	T3	Third T vector value
 
         """
-        self.r11 = parse_float(parameters[1])
-        self.r12 = parse_float(parameters[2])
-        self.r13 = parse_float(parameters[3])
-        self.t1 = parse_float(parameters[4])
-        self.r21 = parse_float(parameters[5])
-        self.r22 = parse_float(parameters[6])
-        self.r23 = parse_float(parameters[7])
-        self.t2 = parse_float(parameters[8])
-        self.r31 = parse_float(parameters[9])
-        self.r32 = parse_float(parameters[10])
-        self.r33 = parse_float(parameters[11])
-        self.t3 = parse_float(parameters[12])
+        # The parameter data is ordered R1, T1, R2, T2, R3, T3, which
+        # maps directly onto the top 3x4 block of the affine matrix
+        self._affine = np.eye(4)
+        self._affine[:3] = parse_floats(parameters[1:13]).reshape(3, 4)
+
+    @property
+    def r11(self):
+        """Rotation matrix entry R11"""
+        return self._affine[0, 0]
+
+    @property
+    def r12(self):
+        """Rotation matrix entry R12"""
+        return self._affine[0, 1]
+
+    @property
+    def r13(self):
+        """Rotation matrix entry R13"""
+        return self._affine[0, 2]
+
+    @property
+    def t1(self):
+        """Translation vector entry T1"""
+        return self._affine[0, 3]
+
+    @property
+    def r21(self):
+        """Rotation matrix entry R21"""
+        return self._affine[1, 0]
+
+    @property
+    def r22(self):
+        """Rotation matrix entry R22"""
+        return self._affine[1, 1]
+
+    @property
+    def r23(self):
+        """Rotation matrix entry R23"""
+        return self._affine[1, 2]
+
+    @property
+    def t2(self):
+        """Translation vector entry T2"""
+        return self._affine[1, 3]
+
+    @property
+    def r31(self):
+        """Rotation matrix entry R31"""
+        return self._affine[2, 0]
+
+    @property
+    def r32(self):
+        """Rotation matrix entry R32"""
+        return self._affine[2, 1]
+
+    @property
+    def r33(self):
+        """Rotation matrix entry R33"""
+        return self._affine[2, 2]
+
+    @property
+    def t3(self):
+        """Translation vector entry T3"""
+        return self._affine[2, 3]
 
     def __repr__(self):
         txt = "IGES 124 Transformation Matrix\n"
-        txt += str(self.to_affine())
+        txt += str(self._affine)
         return txt
 
     def to_affine(self):
         """Return a 4x4 affline transformation matrix"""
-        return np.array(
-            [
-                [self.r11, self.r12, self.r13, self.t1],
-                [self.r21, self.r22, self.r23, self.t2],
-                [self.r31, self.r32, self.r33, self.t3],
-                [0, 0, 0, 1],
-            ]
-        )
+        return self._affine.copy()
 
     @assert_full_module_variant
     def _to_vtk(self):
@@ -194,6 +379,30 @@ class ConicArc(Entity):
     # A hyperbola if Q2 < 0 and Q1 != 0.
     # A parabola if Q2 = 0 and Q1 != 0.
 
+    # ``d`` is shared with the directory entry slot of ``Entity``
+    __slots__ = (
+        "a",
+        "b",
+        "c",
+        "e",
+        "f",
+        "x1",
+        "y1",
+        "z1",
+        "x2",
+        "y2",
+        "z2",
+        "q1",
+        "q2",
+        "q3",
+        "conic_kind",
+    )
+
+    # values of ``conic_kind``
+    ELLIPSE = 0
+    HYPERBOLA = 1
+    PARABOLA = 2
+
     def _add_parameters(self, parameters):
         """
         Index	Type	Name	Description
@@ -210,30 +419,46 @@ class ConicArc(Entity):
         11	REAL	Y2	y coordinate of end point
         12	REAL	Z2	z coordinate of end point
         """
-        self.a = parameters[1]  #  coefficient of xt^2
-        self.b = parameters[2]  #  coefficient of xtyt
-        self.c = parameters[3]  #  coefficient of yt^2
-        self.d = parameters[4]  #  coefficient of xt
-        self.e = parameters[5]  #  coefficient of yt
-        self.f = parameters[6]  #  scalar coefficient
-        self.x1 = parameters[7]  #  x coordinate of start point
-        self.y1 = parameters[8]  #  y coordinate of start point
-        self.z1 = parameters[9]  #  z coordinate of start point
-        self.x2 = parameters[10]  #  x coordinate of end point
-        self.y2 = parameters[11]  #  y coordinate of end point
-        self.z2 = parameters[12]  #  z coordinate of end point
+        (
+            self.a,  #  coefficient of xt^2
+            self.b,  #  coefficient of xtyt
+            self.c,  #  coefficient of yt^2
+            self.d,  #  coefficient of xt
+            self.e,  #  coefficient of yt
+            self.f,  #  scalar coefficient
+            self.x1,  #  x coordinate of start point
+            self.y1,  #  y coordinate of start point
+            self.z1,  #  z coordinate of start point
+            self.x2,  #  x coordinate of end point
+            self.y2,  #  y coordinate of end point
+            self.z2,  #  z coordinate of end point
+        ) = parse_floats(parameters[1:13]).tolist()
+
+        # Classify the parent conic once here, so that code handling
+        # many arcs can dispatch on ``conic_kind`` alone
+        a, b, c, d, e, f = self.a, self.b / 2, self.c, self.d / 2, self.e / 2, self.f
+        self.q1 = a * (c * f - e * e) - b * (b * f - e * d) + d * (b * e - c * d)
+        self.q2 = a * c - b * b
+        self.q3 = a + c
+        if self.q2 > 0 and self.q1 * self.q3 < 0:
+            self.conic_kind = self.ELLIPSE
+        elif self.q2 < 0 and self.q1 != 0:
+            self.conic_kind = self.HYPERBOLA
+        else:
+            self.conic_kind = self.PARABOLA
 
     def __repr__(self):
-        info = "Conic Arc\nIGES Type 104\n"
-        info += f"Start:  ({self.x1:f}, {self.y1:f}, {self.z1:f})\n"
-        info += f"End:    ({self.x2:f}, {self.y2:f}, {self.z2:f})\n"
-        info += "Coefficient of x**2: %f" % self.a
-        info += "Coefficient of x*y:  %f" % self.b
-        info += "Coefficient of y**2: %f" % self.c
-        info += "Coefficient of x:    %f" % self.d
-        info += "Coefficient of y:    %f" % self.e
-        info += "Scalar coefficient:  %f" % self.f
-        return info
+        return (
+            "Conic Arc\nIGES Type 104\n"
+            f"Start:  ({self.x1:f}, {self.y1:f}, {self.z1:f})\n"
+            f"End:    ({self.x2:f}, {self.y2:f}, {self.z2:f})\n"
+            f"Coefficient of x**2: {self.a:f}\n"
+            f"Coefficient of x*y:  {self.b:f}\n"
+            f"Coefficient of y**2: {self.c:f}\n"
+            f"Coefficient of x:    {self.d:f}\n"
+            f"Coefficient of y:    {self.e:f}\n"
+            f"Scalar coefficient:  {self.f:f}"
+        )
 
     @assert_full_module_variant
     def to_vtk(self):
@@ -263,6 +488,9 @@ class RationalBSplineCurve(Entity):
     """
 
     def _add_parameters(self, parameters):
+        # meshes from to_vtk, keyed by delta
+        self._vtk_cache = {}
+
         self.K = int(parameters[1])
         self.M = int(parameters[2])
         self.prop1 = int(parameters[3])
@@ -273,29 +501,23 @@ class RationalBSplineCurve(Entity):
         self.N = 1 + self.K - self.M
         self.A = self.N + 2 * self.M
 
+        # Knots, weights, control points and parameter values are parsed
+        # in bulk and then sliced out (offsets are relative to index 7)
+        values = parse_floats(parameters[7 : 14 + self.A + 4 * self.K])
+
         # Knot sequence
-        self.T = []
-        for i in range(7, 7 + self.A + 1):
-            self.T.append(parse_float(parameters[i]))
+        self.T = values[: self.A + 1]
 
         # Weights
-        self.W = []
-        for i in range(self.A + 8, self.A + self.K + 8):
-            self.W.append(parse_float(parameters[i]))
-
-        # Control points
-        self.control_points = []
-        for i in range(9 + self.A + self.K, 9 + self.A + 4 * self.K + 1, 3):
-            point = (
-                parse_float(parameters[i]),
-                parse_float(parameters[i + 1]),
-                parse_float(parameters[i + 2]),
-            )
-            self.control_points.append(point)
+        self.W = values[self.A + 1 : self.A + self.K + 1]
+
+        # Control points, shape (K + 1, 3)
+        control_points = values[self.A + self.K + 2 : self.A + 4 * self.K + 5]
+        self.control_points = control_points.reshape(-1, 3)
 
         # Parameter values
-        self.V0 = parse_float(parameters[12 + self.A + 4 * self.K])
-        self.V1 = parse_float(parameters[13 + self.A + 4 * self.K])
+        self.V0 = float(values[self.A + 4 * self.K + 5])
+        self.V1 = float(values[self.A + 4 * self.K + 6])
 
         # Unit normal (only for planar curves)
         if len(parameters) > 14 + self.A + 4 * self.K + 1:
@@ -324,14 +546,25 @@ class RationalBSplineCurve(Entity):
         curve = NURBS.Curve()
         curve._kv_normalize = False
         curve.degree = self.M
-        curve.ctrlpts = self.control_points
-        curve.weights = self.W + [1]
-        curve.knotvector = self.T  # Set knot vector
+        curve.ctrlpts = self.control_points.tolist()
+        curve.weights = self.W.tolist() + [1]
+        curve.knotvector = self.T.tolist()  # Set knot vector
         return curve
 
     @assert_full_module_variant
     def to_vtk(self, delta=0.01):
-        """Set evaluation delta (controls the number of curve points)"""
+        """Set evaluation delta (controls the number of curve points)
+
+        The evaluated curve is cached for each ``delta`` and a copy of
+        the cached mesh is returned.
+        """
+        key = round(delta, 9)
+        if key not in self._vtk_cache:
+            self._vtk_cache[key] = self._to_vtk(delta)
+        return self._vtk_cache[key].copy()
+
+    def _to_vtk(self, delta):
+        """Evaluate the curve and return it as a ``pyvista.PolyData``"""
         # Create a 3-dimensional B-spline Curve
         curve = self.to_geomdl()
         curve.delta = delta
@@ -339,11 +572,13 @@ class RationalBSplineCurve(Entity):
         # spline segfaults here sometimes...
         # return pv.Spline(np.array(curve.evalpts))
 
-        n_points = len(curve.evalpts)
+        # evalpts is recomputed on every access, so only read it once
+        points = np.asarray(curve.evalpts, dtype=np.float64)
+        n_points = len(points)
         faces = np.arange(-1, n_points)
         faces[0] = n_points
         line = pv.PolyData()
-        line.points = np.array(curve.evalpts)
+        line.points = points
         line.lines = faces
         return line
 
@@ -486,9 +721,10 @@ class RationalBSplineSurface(Entity):
         return self._v1
 
     def _add_parameters(self, input_parameters):
-        parameters = np.array(
-            [parse_float(param) for param in input_parameters], dtype=float
-        )
+        # meshes from to_vtk, keyed by delta
+        self._vtk_cache = {}
+
+        parameters = parse_floats(input_parameters)
 
         self._k1 = int(parameters[1])  # Upper index of first sum
         self._k2 = int(parameters[2])  # Upper index of second sum
@@ -533,47 +769,49 @@ class RationalBSplineSurface(Entity):
         self._v1 = parameters[en+3]  # End second parameter value
 
     def __repr__(self):
-        info = "Rational B-Spline Surface\n"
-        info += "    Upper index of first sum:          %d\n" % self._k1
-        info += "    Upper index of second sum:         %d\n" % self._k2
-        info += "    Degree of first basis functions:   %d\n" % self._m1
-        info += "    Degree of second basis functions:  %d\n" % self._m2
+        parts = [
+            "Rational B-Spline Surface",
+            "    Upper index of first sum:          %d" % self._k1,
+            "    Upper index of second sum:         %d" % self._k2,
+            "    Degree of first basis functions:   %d" % self._m1,
+            "    Degree of second basis functions:  %d" % self._m2,
+        ]
 
         if self.flag1:
-            info += "    Closed in the first direction\n"
+            parts.append("    Closed in the first direction")
         else:
-            info += "    Open in the first direction\n"
+            parts.append("    Open in the first direction")
 
         if self.flag2:
-            info += "    Closed in the second direction\n"
+            parts.append("    Closed in the second direction")
         else:
-            info += "    Open in the second direction\n"
+            parts.append("    Open in the second direction")
 
         if self.flag3:
-            info += "    Rational\n"
+            parts.append("    Rational")
         else:
-            info += "    Polynomial\n"
+            parts.append("    Polynomial")
 
         if self.flag4:
-            info += "    Nonperiodic in first direction\n"
+            parts.append("    Nonperiodic in first direction")
         else:
-            info += "    Periodic in the first direction\n"
+            parts.append("    Periodic in the first direction")
 
         if self.flag5:
-            info += "    Nonperiodic in second direction\n"
+            parts.append("    Nonperiodic in second direction")
         else:
-            info += "    Periodic in the second direction\n"
-
-        info += "    Knot 1: %s\n" % str(self.knot1)
-        info += "    Knot 2: %s\n" % str(self.knot2)
-
-        info += "    u0: %f\n" % self.u0
-        info += "    u1: %f\n" % self.u1
-        info += "    v0: %f\n" % self.v0
-        info += "    v1: %f\n" % self.v1
-
-        info += "    Control Points: %d" % len(self._cp)
-        return info
+            parts.append("    Periodic in the second direction")
+
+        parts += [
+            "    Knot 1: %s" % str(self.knot1),
+            "    Knot 2: %s" % str(self.knot2),
+            "    u0: %f" % self.u0,
+            "    u1: %f" % self.u1,
+            "    v0: %f" % self.v0,
+            "    v1: %f" % self.v1,
+            "    Control Points: %d" % len(self._cp),
+        ]
+        return "\n".join(parts)
 
     @assert_full_module_variant
     def to_geomdl(self):
@@ -597,7 +835,7 @@ class RationalBSplineSurface(Entity):
         return surf
 
     @assert_full_module_variant
-    def to_vtk(self, delta=0.025):
+    def to_vtk(self, delta=0.025, use_geomdl=False):
         """Return a pyvista.PolyData Mesh
 
         Parameters
@@ -606,28 +844,83 @@ class RationalBSplineSurface(Entity):
             Resolution of the surface.  Higher number result in a
             denser mesh at the cost of compute time.
 
+        use_geomdl : bool, optional
+            Tessellate the surface with ``geomdl`` rather than the
+            built-in ``numpy`` evaluator.  This is considerably slower
+            and mainly useful for verification.
+
         Returns
         -------
         mesh : ``pyvista.PolyData``
             ``pyvista`` mesh
 
+        Notes
+        -----
+        The tessellated surface is cached for each ``delta`` and a copy
+        of the cached mesh is returned.
+
         Examples
         --------
         >>> mesh = bsurf.to_vtk()
         >>> mesh.plot()
         """
+        key = (round(delta, 9), use_geomdl)
+        if key not in self._vtk_cache:
+            if use_geomdl:
+                self._vtk_cache[key] = self._to_vtk_geomdl(delta)
+            else:
+                self._vtk_cache[key] = self._to_vtk(delta)
+        return self._vtk_cache[key].copy()
+
+    def _to_vtk(self, delta):
+        """Tessellate the surface and return it as a ``pyvista.PolyData``
+
+        Samples the surface on the same parameter grid and with the same
+        triangulation as ``geomdl``.  As with ``to_geomdl``, the weights
+        are not applied.
+        """
+        n_samples = int(np.floor(1.0 / delta + 0.5))
+
+        # the u direction of the surface is the second knot sequence
+        basis_u = _sampled_bspline_basis(self._m2, tuple(self._knot2), n_samples)
+        basis_v = _sampled_bspline_basis(self._m1, tuple(self._knot1), n_samples)
+
+        # contract one direction at a time: (n, k2+1) x (k2+1, (k1+1)*3)
+        # followed by (n, k1+1) x (k1+1, 3) for each row of samples
+        points = basis_u @ self._cp.reshape(self._k2 + 1, -1)
+        points = basis_v @ points.reshape(n_samples, self._k1 + 1, 3)
+        points = points.reshape(-1, 3)
+
+        # split each quad of the sample grid into two triangles
+        grid = np.arange(n_samples * n_samples).reshape(n_samples, n_samples)
+        v1 = grid[:-1, :-1].ravel()
+        v2 = grid[1:, :-1].ravel()
+        v3 = grid[1:, 1:].ravel()
+        v4 = grid[:-1, 1:].ravel()
+        faces = np.empty((v1.size, 2, 4), dtype=int)
+        faces[:, :, 0] = 3
+        faces[:, 0, 1:] = np.column_stack((v1, v2, v3))
+        faces[:, 1, 1:] = np.column_stack((v1, v3, v4))
+
+        return pv.PolyData(points, faces.ravel())
+
+    def _to_vtk_geomdl(self, delta):
+        """Tessellate the surface using ``geomdl``"""
         surf = self.to_geomdl()
         # Set evaluation delta
         surf.delta = delta
 
-        # Evaluate surface points
+        # Evaluate surface points.  The tessellated vertices are
+        # re-evaluated by geomdl at normalized parameters, which is wrong
+        # for the unnormalized knot vectors used here, so use evalpts
         surf.evaluate()
+        points = np.asarray(surf.evalpts, dtype=np.float64)
 
-        faces = []
-        for face in surf.faces:
-            faces.extend([3] + face.vertex_ids)
+        faces = np.empty((len(surf.faces), 4), dtype=int)
+        faces[:, 0] = 3
+        faces[:, 1:] = [face.vertex_ids for face in surf.faces]
 
-        return pv.PolyData(np.array(surf.vertices), np.array(faces))
+        return pv.PolyData(points, faces.ravel())
 
 
 class CircularArc(Entity):
@@ -638,6 +931,8 @@ class CircularArc(Entity):
 
     """
 
+    __slots__ = ("z", "x", "y", "x1", "y1", "x2", "y2", "_transform")
+
     def _add_parameters(self, parameters):
         # Index in list    Type of data    Name    Description
         # 1                REAL            Z       z displacement on XT,YT plane
@@ -691,6 +986,73 @@ class CircularArc(Entity):
         return info
 
 
+class Surface_of_Revolution(Entity):
+    """Surface of Revolution (Type 120)
+
+    Surface created by rotating the generatrix curve about the axis
+    line from the start angle to the terminate angle.
+    """
+
+    # Index	Type	Name	Description
+    # 1	Pointer	L	Axis of revolution (Line entity)
+    # 2	Pointer	C	Generatrix entity
+    # 3	REAL	SA	Start angle in radians
+    # 4	REAL	TA	Terminate angle in radians
+    _SCHEMA = (
+        ("axis_pointer", int),
+        ("generatrix_pointer", int),
+        ("start_angle", parse_float),
+        ("end_angle", parse_float),
+    )
+    __slots__ = tuple(name for name, _ in _SCHEMA)
+
+    def _add_parameters(self, parameters):
+        _apply_schema(self, parameters, self._SCHEMA)
+
+    def get_axis(self):
+        return self.iges.from_pointer(self.axis_pointer)
+
+    def get_generatrix(self):
+        return self.iges.from_pointer(self.generatrix_pointer)
+
+    def __repr__(self):
+        info = "IGES Type 120: Surface of Revolution\n"
+        info += f"Angles: {self.start_angle:f} to {self.end_angle:f}"
+        return info
+
+
+class Tabulated_Cylinder(Entity):
+    """Tabulated Cylinder (Type 122)
+
+    Surface created by moving a line segment, parallel to itself, along
+    the directrix curve.
+    """
+
+    # Index	Type	Name	Description
+    # 1	Pointer	DE	Directrix curve entity
+    # 2	REAL	LX	Coordinates of the terminate point of the generatrix
+    # 3	REAL	LY
+    # 4	REAL	LZ
+    _SCHEMA = (
+        ("directrix_pointer", int),
+        ("lx", parse_float),
+        ("ly", parse_float),
+        ("lz", parse_float),
+    )
+    __slots__ = tuple(name for name, _ in _SCHEMA)
+
+    def _add_parameters(self, parameters):
+        _apply_schema(self, parameters, self._SCHEMA)
+
+    def get_directrix(self):
+        return self.iges.from_pointer(self.directrix_pointer)
+
+    def __repr__(self):
+        info = "IGES Type 122: Tabulated Cylinder\n"
+        info += f"Generatrix end: ({self.lx:f}, {self.ly:f}, {self.lz:f})"
+        return info
+
+
 class Composite_Curve(Entity):
     """Groups other curves to form a composite. Can use Ordered List, Point, 
     Connected Point, and Parameterized Curve entities."""
@@ -705,17 +1067,13 @@ class Composite_Curve(Entity):
         
         1+N	Pointer	DE(N)	Pointer to last curve
         """
-        self.parameters = parameters
+        if KEEP_RAW_PARAMETERS:
+            self.parameters = parameters
         self.N_curves   = int(parameters[1])
-        self.curves     = []
-        for ii in range(2,self.N_curves+2):
-            self.curves.append(int(parameters[ii]))
+        self.curves     = np.asarray(parameters[2 : 2 + self.N_curves], dtype=np.int64)
             
     def get_curves(self):
-        curves = []
-        for curve_ptr in self.curves:
-            curves.append(self.iges.from_pointer(curve_ptr))
-        return curves
+        return self.iges.from_pointers(self.curves)
     
 class Curve_On_A_Parametric_Surface(Entity):
     """Associates a curve and a surface, gives how a curve lies on the specified surface."""
@@ -738,7 +1096,8 @@ class Curve_On_A_Parametric_Surface(Entity):
                                 2 = C(t)
                                 3 = Both equal
         """
-        self.parameters      = parameters
+        if KEEP_RAW_PARAMETERS:
+            self.parameters = parameters
         self.how_created     = int(parameters[1])
         self.surface_pointer = int(parameters[2])
         self.curve_pointer   = int(parameters[3])
@@ -765,14 +1124,15 @@ class Trimmed_Surface(Entity):
             5	Pointer	Inner1	Pointer to first inner curve boundary
             5+N	Pointer	InnerN	Pointer to last inner curve boundary
             """
-            self.parameters       = parameters
+            if KEEP_RAW_PARAMETERS:
+                self.parameters = parameters
             self.surface_pointer  = int(parameters[1])
             self.flag_boundary    = int(parameters[2])
             self.n_inner_boundary = int(parameters[3])
             self.OuterBound       = int(parameters[4])
-            self.inner_curve_boundary = []
-            for ii in range(5,len(parameters[4:])):
-                self.inner_curve_boundary.append(parameters[ii])
+            self.inner_curve_boundary = np.asarray(
+                parameters[5 : 5 + self.n_inner_boundary], dtype=np.int64
+            )
                 
         def get_surface(self):
             return self.iges.from_pointer(self.surface_pointer)
@@ -781,7 +1141,7 @@ class Trimmed_Surface(Entity):
             return self.iges.from_pointer(self.OuterBound)   
         
         
-class Boundary:
+class Boundary(Entity):
     """Identifies a surface boundary consisting of curves lying on a surface."""
 
     def _add_parameters(self, parameters):
@@ -810,7 +1170,8 @@ class Boundary:
 
         """
 
-        self.parameters = parameters
+        if KEEP_RAW_PARAMETERS:
+            self.parameters = parameters
         self.Type            = int(parameters[1])
         self.pref            = int(parameters[2])
         self.surface_pointer = int(parameters[3])
@@ -827,35 +1188,35 @@ class Boundary:
             
             
     def get_space_curves(self):
-        scs = []
-        for sc in self.space_curves:
-            scs.append(self.iges.from_pointer(sc))
-        return sc
+        return self.iges.from_pointers(self.space_curves)
+
     def get_surface(self):
         return self.iges.from_pointer(self.surface_pointer)
+
     def get_model_curves(self):
-        mcs = []
-        for mc in self.model_curves:
-            mcs.append(self.iges.from_pointer(mc))
-        return mc
+        """List of the parameter space curves of each model space curve"""
+        from_pointers = self.iges.from_pointers
+        return [from_pointers(mcs) for mcs in self.model_curves]
         
         
 
         
 def unpack_boundary_curves_parameters(parameters,start_index):
-    
-    # Get the parameters
-    space_curve = parameters[start_index]
-    flag_1      = parameters[start_index+1]
-    K1          = parameters[start_index+2]
-    end_index   = start_index + 3 + K1 
-    list_curves = parameters[(start_index+3):end_index]
-    
-    return space_curve, flag_1, list_curves, end_index +1
+    """Unpack the parameters of a single model space curve of a
+    Boundary entity starting at ``start_index``. Returns the curve
+    pointer, its orientation flag, the parameter space curve pointers
+    and the index of the next model space curve."""
+    space_curve = int(parameters[start_index])
+    flag_1      = int(parameters[start_index + 1])
+    K1          = int(parameters[start_index + 2])
+    end_index   = start_index + 3 + K1
+    list_curves = np.asarray(parameters[start_index + 3 : end_index], dtype=np.int64)
+
+    return space_curve, flag_1, list_curves, end_index
             
 
         
-class Bounded_Surface:
+class Bounded_Surface(Entity):
     """Represents a surface bounded by Boundary Entities."""
 
     def _add_parameters(self, parameters):    
@@ -871,22 +1232,24 @@ class Bounded_Surface:
         4	Pointer	B1	Pointer to first boundary entity
         3+N	Pointer	BN	Pointer to last boundary entity   
         """
-        self.parameters      = parameters
+        if KEEP_RAW_PARAMETERS:
+            self.parameters = parameters
         self.Type            = int(parameters[1])
         self.surface_pointer = int(parameters[2])
         self.N_boundaries    = int(parameters[3])
-        self.B               = []  # List of boundaries
-        for ii in range(4,4+self.N_boundaries):
-            self.B.append(int(parameters[ii]))
+        # Pointers to the boundaries
+        self.B = np.asarray(parameters[4 : 4 + self.N_boundaries], dtype=np.int64)
             
     def get_surface(self):
         return self.iges.from_pointer(self.surface_pointer)
     
+    @functools.cached_property
+    def boundaries(self):
+        """Boundary entities, resolved on first access"""
+        return self.iges.from_pointers(self.B)
+
     def get_boundaries(self):
-        Bs = []
-        for B in self.B:
-            Bs.append(self.iges.from_pointer(B))
-        return Bs
+        return self.boundaries
             
         
     
@@ -897,6 +1260,14 @@ class Face(Entity):
     """Defines a bound portion of three dimensional space (R^3) which
     has a finite area. Used to construct B-Rep Geometries."""
 
+    __slots__ = (
+        "surf_pointer",
+        "n_loops",
+        "outer_loop_flag",
+        "loop_pointers",
+        "_loops",
+    )
+
     def _add_parameters(self, parameters):
         """
         Parameter Data
@@ -909,21 +1280,19 @@ class Face(Entity):
         4	Pointer	Loop1	Pointer to first loop of the face
         3+N	Pointer	LoopN	Pointer to last loop of the face
         """
-        self.surf_pointer = int(parameters[1])
-        self.n_loops = int(parameters[2])
-        self.outer_loop_flag = bool(parameters[3])
-
-        self.loop_pointers = []
-        for i in range(self.n_loops):
-            self.loop_pointers.append(int(parameters[4 + i]))
+        self.surf_pointer, self.n_loops, outer_loop_flag = map(int, parameters[1:4])
+        self.outer_loop_flag = bool(outer_loop_flag)
+        self.loop_pointers = np.asarray(
+            parameters[4 : 4 + self.n_loops], dtype=np.int64
+        )
+        self._loops = None
 
     @property
     def loops(self):
-        loops = []
-        for ptr in self.loop_pointers:
-            loops.append(self.iges.from_pointer(ptr))
-
-        return loops
+        """Loop entities of the face, resolved on first access"""
+        if self._loops is None:
+            self._loops = self.iges.from_pointers(self.loop_pointers)
+        return self._loops
 
     def __repr__(self):
         info = "IGES Type 510: Face\n"
@@ -938,6 +1307,15 @@ class Loop(Entity):
     """Defines a loop, specifying a bounded face, for B-Rep
     geometries."""
 
+    __slots__ = (
+        "n_edges",
+        "edges_arr",
+        "flags",
+        "curve_offsets",
+        "psc_arr",
+        "iso_flags",
+    )
+
     def _add_parameters(self, parameters):
         """Parameter Data
         Index   Type    Name                Description
@@ -957,30 +1335,54 @@ class Loop(Entity):
         6+2K1	Pointer	PSC(1, K1)          Last parametric space curve of E1
         7+2K1	INT	Type2               Type of Edge 2
         """
-        self.parameters = parameters
-        self.n_edges = int(self.parameters[1])
-        self._edges = []
+        if KEEP_RAW_PARAMETERS:
+            self.parameters = parameters
+        self.n_edges = int(parameters[1])
+        edges, self.curve_offsets, curves = _parse_loop(
+            np.asarray(parameters, dtype=np.int64), self.n_edges
+        )
+
+        # edges_arr has the columns type, e1, index1 and k1, and
+        # psc_arr[curve_offsets[i]:curve_offsets[i + 1]] are the parameter
+        # space curves of edge i.  The orientation and isoparametric flags
+        # are stored one bit each, see flag1 and iso.
+        self.edges_arr = edges[:, [0, 1, 2, 4]]
+        self.flags = np.packbits(edges[:, 3] != 0)
+        self.psc_arr = curves[:, 1].copy()
+        self.iso_flags = np.packbits(curves[:, 0] != 0)
+
+    def flag1(self, i):
+        """Orientation flag of edge ``i``"""
+        return bool((self.flags[i >> 3] >> (7 - (i & 7))) & 1)
 
-        c = 0
-        for i in range(self.n_edges):
+    def iso(self, j):
+        """Isoparametric flag of parameter space curve ``j``"""
+        return bool((self.iso_flags[j >> 3] >> (7 - (j & 7))) & 1)
+
+    @property
+    def edges(self):
+        """List of edges as dictionaries, built from the edge and curve
+        arrays"""
+        flags = np.unpackbits(self.flags, count=self.n_edges).tolist()
+        iso = np.unpackbits(self.iso_flags, count=len(self.psc_arr)).tolist()
+        psc = self.psc_arr.tolist()
+        offsets = self.curve_offsets.tolist()
+        edges = []
+        for i, (type_, e1, index1, k1) in enumerate(self.edges_arr.tolist()):
             edge = {
-                "type": int(self.parameters[2 + c]),
-                "e1": int(self.parameters[3 + c]),  # first vertex or edge list
-                "index1": int(self.parameters[4 + c]),  # index of edge in e1
-                "flag1": bool(self.parameters[5 + c]),  # orientation flag
-                "k1": int(self.parameters[6 + c]),
-            }  # n curves
-            curves = []
-            for j in range(edge["k1"]):
-                curve = {
-                    "iso": bool(self.parameters[7 + c + j * 2]),  # isopara flag
-                    "psc": int(self.parameters[8 + c + j * 2]),
-                }  # space curve
-                curves.append(curve)
-            c += 5 + 2 * edge["k1"]
-
-            edge["curves"] = curves
-            self._edges.append(edge)
+                "type": type_,
+                "e1": e1,  # first vertex or edge list
+                "index1": index1,  # index of edge in e1
+                "flag1": bool(flags[i]),  # orientation flag
+                "k1": k1,  # n curves
+                "curves": [
+                    # isopara flag and space curve
+                    {"iso": bool(iso[j]), "psc": psc[j]}
+                    for j in range(offsets[i], offsets[i + 1])
+                ],
+            }
+            edges.append(edge)
+        return edges
 
     # @property
     # def edge_lists(self):
@@ -1001,6 +1403,18 @@ class EdgeList(Entity):
 
     _iges_type = 504
 
+    _edge_dtype = np.dtype(
+        [
+            ("curve1", np.int64),  # first model space curve
+            ("svl", np.int64),  # vertex list for start vertex
+            ("s", np.int64),  # start index
+            ("evl", np.int64),  # vertex list for end vertex
+            ("e", np.int64),  # index of end vertex in evl n
+        ]
+    )
+
+    __slots__ = ("n_edges", "_rec")
+
     def _add_parameters(self, parameters):
         """
         Parameter Data
@@ -1021,19 +1435,24 @@ class EdgeList(Entity):
         5N	Pointer	EVLN	Vertex list for end vertex
         5N+1	INT	EN	Index of end vertex in EVLN
         """
-        self.parameters = parameters
+        if KEEP_RAW_PARAMETERS:
+            self.parameters = parameters
         self.n_edges = int(parameters[1])
 
-        self.edges = []
-        for i in range(self.n_edges):
-            edge = {
-                "curve1": int(parameters[2 + 5 * i]),  # first model space curve
-                "svl": int(parameters[3 + 5 * i]),  # vertex list for start vertex
-                "s": int(parameters[4 + 5 * i]),  # start index
-                "evl": int(parameters[5 + 5 * i]),  # vertex list for end vertex
-                "e": int(parameters[6 + 5 * i]),
-            }  # index of end vertex in evl n
-            self.edges.append(edge)
+        values = np.asarray(parameters[2 : 2 + 5 * self.n_edges], dtype=np.int64)
+        self._rec = values.view(self._edge_dtype)
+
+    @property
+    def edges_arr(self):
+        """Edges as an ``(n_edges, 5)`` array with the columns curve1, svl,
+        s, evl and e"""
+        return self._rec.view(np.int64).reshape(self.n_edges, 5)
+
+    @property
+    def edges(self):
+        """List of edges as dictionaries, built from the edge records"""
+        keys = self._edge_dtype.names
+        return [dict(zip(keys, edge)) for edge in self._rec.tolist()]
 
     # @property
     # def curve(self, ):
@@ -1041,11 +1460,14 @@ class EdgeList(Entity):
 
     def __getitem__(self, indices):
         # TODO: limit spline based on start and end point
-        ptr = self.edges[indices]["curve1"]
-        return self.iges.from_pointer(ptr)
+        return self.iges.from_pointer(int(self._rec["curve1"][indices]))
+
+    def curves_bulk(self):
+        """Model space curves of all edges"""
+        return self.iges.from_pointers(self._rec["curve1"])
 
     def __len__(self):
-        return len(self.edges)
+        return self.n_edges
 
     def __repr__(self):
         """Return the representation of EdgesList."""
@@ -1057,6 +1479,8 @@ class VertexList(Entity):
 
     _iges_type = 502
 
+    __slots__ = ("n_points", "points_xyz")
+
     def _add_parameters(self, parameters):
         """Adds Parameter Data.
 
@@ -1073,13 +1497,17 @@ class VertexList(Entity):
         3N	REAL	YN
         3N+1	REAL	ZN
         """
-        self.parameters = parameters
+        if KEEP_RAW_PARAMETERS:
+            self.parameters = parameters
         self.n_points = int(parameters[1])
-        self.points = []
-        for i in range(self.n_points):
-            point = [
-                parse_float(self.parameters[2 + i * 3]),
-                parse_float(self.parameters[3 + i * 3]),
-                parse_float(self.parameters[4 + i * 3]),
-            ]
-            self.points.append(point)
+        coordinates = parse_floats(parameters[2 : 2 + 3 * self.n_points])
+        self.points_xyz = coordinates.reshape(self.n_points, 3)
+
+    @property
+    def points(self):
+        """Vertices as a list of ``[x, y, z]`` lists.
+
+        Prefer ``points_xyz``, the ``(n_points, 3)`` array these are
+        built from on each access.
+        """
+        return self.points_xyz.tolist()
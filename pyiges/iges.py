@@ -1,3 +1,4 @@
+import numpy as np
 from tqdm import tqdm
 
 from pyiges import geometry
@@ -123,6 +124,65 @@ class Iges:
 
         return items
 
+    @assert_full_module_variant
+    def points_to_vtk(self):
+        """Convert all points to a single ``pyvista.PolyData``
+
+        Unlike ``points(as_vtk=True, merge=True)``, the coordinates of
+        all points are gathered into one array and a single mesh is
+        created rather than one mesh per point.
+
+        Returns
+        -------
+        mesh : pyvista.PolyData
+            All points with one vertex cell per point.
+
+        Examples
+        --------
+        >>> import pyiges
+        >>> from pyiges import examples
+        >>> sample = pyiges.read(examples.sample)
+        >>> mesh = sample.points_to_vtk()
+        >>> mesh.n_points
+        4
+        """
+        points = self.points()
+        if not points:
+            return pyvista.PolyData()
+        return pyvista.PolyData(np.array([point.coordinate for point in points]))
+
+    @assert_full_module_variant
+    def lines_to_vtk(self):
+        """Convert all lines to a single ``pyvista.PolyData``
+
+        Unlike ``lines(as_vtk=True, merge=True)``, the end points of all
+        lines are gathered into one array and a single mesh is created
+        rather than one mesh per line.
+
+        Returns
+        -------
+        mesh : pyvista.PolyData
+            All lines with one line cell per line.
+
+        Examples
+        --------
+        >>> lines = iges.lines_to_vtk()
+        >>> lines.n_lines
+        98
+        """
+        lines = self.lines()
+        if not lines:
+            return pyvista.PolyData()
+        vertices = np.concatenate([line.coordinates for line in lines])
+
+        # each cell is [2, start, end]
+        n_lines = len(lines)
+        cells = np.empty((n_lines, 3), dtype=int)
+        cells[:, 0] = 2
+        cells[:, 1] = np.arange(0, 2 * n_lines, 2)
+        cells[:, 2] = cells[:, 1] + 1
+        return pyvista.PolyData(vertices, lines=cells.ravel())
+
     def points(self, as_vtk=False, merge=False, **kwargs):
         """Return all points"""
         return self._return_type(geometry.Point, as_vtk, merge, **kwargs)
@@ -192,6 +252,12 @@ class Iges:
     def Trimmed_Surfaces(self, to_vtk=False, merge=False, **kwargs):
         return self._return_type(geometry.Trimmed_Surface, to_vtk, merge, **kwargs)
 
+    def Boundaries(self, to_vtk=False, merge=False, **kwargs):
+        return self._return_type(geometry.Boundary, to_vtk, merge, **kwargs)
+
+    def Bounded_Surfaces(self, to_vtk=False, merge=False, **kwargs):
+        return self._return_type(geometry.Bounded_Surface, to_vtk, merge, **kwargs)
+
     def circular_arcs(self, to_vtk=False, merge=False, **kwargs):
         """All circular_arcs"""
         return self._return_type(geometry.CircularArc, to_vtk, merge, **kwargs)
@@ -240,7 +306,13 @@ class Iges:
 
     def from_pointer(self, ptr):
         """Return an iges object according to an iges pointer"""
-        return self._entities[self._pointers[ptr]]
+        return self._pointers[ptr]
+
+    def from_pointers(self, ptrs):
+        """Return a list of iges objects according to a sequence of iges
+        pointers, such as an array of pointers stored on an entity"""
+        pointers = self._pointers
+        return [pointers[ptr] for ptr in np.asarray(ptrs).tolist()]
 
     @staticmethod
     def _parse_separators_from_first_global_line(line):
@@ -266,7 +338,7 @@ class Iges:
 
     def _read(self, filename):
         with open(filename) as f:
-            param_string = ""
+            param_lines = []
             entity_list = []
             entity_index = 0
             first_dict_line = True
@@ -277,7 +349,7 @@ class Iges:
             entities_to_discard = []
 
             # for line in tqdm(f.readlines(), desc='Reading file'):
-            for line_no, line in enumerate(f.readlines(), start=1):
+            for line_no, line in enumerate(f, start=1):
                 data = line[:80]
                 id_code = line[72]
 
@@ -316,9 +388,9 @@ class Iges:
                         elif entity_type_number == 118:  # Ruled surface
                             e = Entity(self)
                         elif entity_type_number == 120:  # Surface of revolution
-                            e = Entity(self)
+                            e = geometry.Surface_of_Revolution(self)
                         elif entity_type_number == 122:  # Tabulated cylinder
-                            e = Entity(self)
+                            e = geometry.Tabulated_Cylinder(self)
                         elif entity_type_number == 124:  # Transformation matrix
                             e = geometry.Transformation(self)
                         elif entity_type_number == 126:  # Rational B-spline curve
@@ -386,17 +458,19 @@ class Iges:
                         entity_index += 1
 
                 elif id_code == "P":  # Parameter data
-                    # Concatenate multiple lines into one string
+                    # Collect the lines of an entity and only join them
+                    # once its record separator has been reached
                     if first_param_line:
-                        param_string = data[:64]
+                        param_lines = []
                         directory_pointer = int(data[64:72].strip())
                         first_param_line = False
-                    else:
-                        param_string += data[:64]
 
-                    if param_string.strip()[-1] == record_sep:
+                    param_data = data[:64]
+                    param_lines.append(param_data)
+                    param_data = param_data.rstrip()
+                    if param_data and param_data[-1] == record_sep:
                         first_param_line = True
-                        param_string = param_string.strip()[:-1]
+                        param_string = "".join(param_lines).strip()[:-1]
                         parameters = param_string.split(param_sep)
                         this_entity = entity_list[pointer_dict[directory_pointer]]
                         try:
@@ -421,11 +495,13 @@ class Iges:
 
         self._entities = entity_list
         self.desc = desc
-        self._pointers = pointer_dict
+        # map each pointer straight to its entity, as the list indices
+        # in pointer_dict are no longer valid after discarding entities
+        self._pointers = {e.sequence_number: e for e in entity_list}
 
     def __getitem__(self, index):
         """Get an item by its pointer"""
-        return self._entities[self._pointers[index]]
+        return self._pointers[index]
 
     @property
     def items(self):
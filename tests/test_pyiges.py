@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 
 import pyiges
-from pyiges import examples
+from pyiges import examples, geometry
 
 DIR_TESTS_REFERENCE_DATA = os.path.join(os.path.dirname(__file__), "reference_data")
 
@@ -71,6 +71,16 @@ def entity(impeller):
     return impeller._entities[0]  # pyiges.entity.Entity
 
 
+def test_parse_floats():
+    values = geometry.parse_floats(["1.5", "-2.0E1", " 3 "])
+    assert values.dtype == np.float64
+    assert values.tolist() == [1.5, -20.0, 3.0]
+
+    # Fortran style exponents
+    values = geometry.parse_floats(["1.5D2", "-3d-1", "4.0"])
+    assert values.tolist() == pytest.approx([150.0, -0.3, 4.0])
+
+
 def test_str(sample):
     assert "Number of Entities: 5" in str(sample)
 
@@ -155,6 +165,34 @@ def test_surfaces_vtk(surf):
     )
 
 
+@adjust_depending_on_package_variant
+def test_surfaces_vtk_cached(surf):
+    mesh = surf.to_vtk(delta=0.1)
+    mesh.points[:] = 0.0
+
+    cached = surf.to_vtk(delta=0.1)
+    assert cached is not mesh
+    assert cached.n_points == 100
+    assert cached.bounds[0] == pytest.approx(-30.547425187)
+
+
+@adjust_depending_on_package_variant
+def test_surfaces_vtk_matches_geomdl_evalpts(impeller):
+    # non-normalized knot vectors on both directions
+    surf = impeller.bspline_surfaces()[63]
+    mesh = surf.to_vtk(delta=0.1)
+
+    gsurf = surf.to_geomdl()
+    gsurf.delta = 0.1
+    gsurf.evaluate()
+    assert mesh.points == pytest.approx(np.array(gsurf.evalpts))
+    assert mesh.n_cells == 2 * 9 * 9
+
+    gmesh = surf.to_vtk(delta=0.1, use_geomdl=True)
+    assert gmesh.points == pytest.approx(mesh.points)
+    assert np.array_equal(gmesh.faces, mesh.faces)
+
+
 @adjust_depending_on_package_variant
 def test_surfaces_to_geomdl(surf):
     gsurf = surf.to_geomdl()
@@ -312,6 +350,8 @@ def test_bsplines_parse(curve):
     assert curve.W == pytest.approx(
         [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
     )
+    assert curve.control_points.shape == (curve.K + 1, 3)
+    assert curve.control_points[0] == pytest.approx([0.531027642, 0.127235606, 0.0])
 
     assert curve.d == {
         "entity_type_number": 126,
@@ -395,6 +435,24 @@ def test_points_vtk(sample):
     )
 
 
+@adjust_depending_on_package_variant
+def test_points_to_vtk(sample):
+    points = sample.points_to_vtk()
+    assert points.n_points == 4
+    assert points.n_verts == 4
+    assert points.points == pytest.approx(
+        np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]])
+    )
+
+
+@adjust_depending_on_package_variant
+def test_lines_to_vtk(impeller):
+    lines = impeller.lines_to_vtk()
+    assert lines.n_lines == 98
+    assert lines.n_points == 196
+    assert lines.points[:2] == pytest.approx(impeller.lines()[0].coordinates)
+
+
 def test_points_parse(sample):
     points = sample.points(as_vtk=False, merge=True)  # pyiges.geometry.Point
 
@@ -686,6 +744,235 @@ def test_transformation_vtk(trafo):
     assert m.GetElement(2, 3) == pytest.approx(5.67397368511119)
 
 
+def test_trimmed_surface_parse(impeller):
+    trimmed = [t for t in impeller.Trimmed_Surfaces() if t.n_inner_boundary]
+    assert len(trimmed) == 2
+    assert trimmed[0].surface_pointer == 2695
+    assert trimmed[0].OuterBound == 2713
+    assert trimmed[0].inner_curve_boundary.tolist() == [2727]
+    assert trimmed[1].inner_curve_boundary.tolist() == [2795]
+
+
+def test_composite_curve_parse(impeller):
+    composite = impeller.Composite_Curves()[0]
+    assert composite.curves.dtype == np.int64
+    assert len(composite.curves) == composite.N_curves
+    assert len(composite.get_curves()) == composite.N_curves
+
+
+def test_keep_raw_parameters(monkeypatch):
+    parameters = ["102", "2", "3", "5"]
+    composite = geometry.Composite_Curve(None)
+    composite._add_parameters(parameters)
+    assert composite.parameters == []
+    assert composite.curves.tolist() == [3, 5]
+
+    monkeypatch.setattr(geometry, "KEEP_RAW_PARAMETERS", True)
+    composite = geometry.Composite_Curve(None)
+    composite._add_parameters(parameters)
+    assert composite.parameters == parameters
+
+
+def test_unpack_boundary_curves_parameters():
+    # MC1, Flag1, K1, PC(1,1), PC(1,2), MC2, Flag2, K2, PC(2,1)
+    parameters = ["141", "1", "2", "7", "2"]
+    parameters += ["11", "0", "2", "13", "15", "17", "1", "1", "19"]
+    space_curve, flag, curves, index = geometry.unpack_boundary_curves_parameters(
+        parameters, 5
+    )
+    assert (space_curve, flag, index) == (11, 0, 10)
+    assert curves.tolist() == [13, 15]
+
+    space_curve, flag, curves, index = geometry.unpack_boundary_curves_parameters(
+        parameters, index
+    )
+    assert (space_curve, flag, index) == (17, 1, 14)
+    assert curves.tolist() == [19]
+
+
+def test_vertex_list_parse():
+    vertex_list = geometry.VertexList(None)
+    vertex_list._add_parameters(["502", "2", "0.0", "1.5", "-2.0", "1D2", "0", "3"])
+    assert vertex_list.n_points == 2
+    assert vertex_list.points_xyz.shape == (2, 3)
+    assert vertex_list.points == [[0.0, 1.5, -2.0], [100.0, 0.0, 3.0]]
+    assert vertex_list.parameters == []
+
+
+def test_edge_list_parse():
+    edge_list = geometry.EdgeList(None)
+    edge_list._add_parameters(["504", "2", "11", "13", "1", "13", "2"] + ["15"] * 5)
+    assert len(edge_list) == 2
+    assert edge_list.edges_arr.tolist() == [[11, 13, 1, 13, 2], [15] * 5]
+    assert edge_list.edges[0] == {"curve1": 11, "svl": 13, "s": 1, "evl": 13, "e": 2}
+
+    edge_list.iges = PointerEcho()
+    assert edge_list[1] == 15
+    assert edge_list.curves_bulk() == [11, 15]
+
+
+def test_loop_parse():
+    # an edge with one parameter space curve followed by one with two
+    parameters = ["508", "2", "0", "21", "1", "1", "1", "0", "23"]
+    parameters += ["0", "21", "2", "0", "2", "1", "25", "0", "27"]
+    loop = geometry.Loop(None)
+    loop._add_parameters(parameters)
+    assert loop.n_edges == 2
+    assert loop.edges_arr.tolist() == [[0, 21, 1, 1], [0, 21, 2, 2]]
+    assert loop.psc_arr.tolist() == [23, 25, 27]
+    assert [loop.flag1(i) for i in range(2)] == [True, False]
+    assert [loop.iso(j) for j in range(3)] == [False, True, False]
+    first, second = loop.edges
+    assert first == {
+        "type": 0,
+        "e1": 21,
+        "index1": 1,
+        "flag1": True,
+        "k1": 1,
+        "curves": [{"iso": False, "psc": 23}],
+    }
+    assert second["flag1"] is False
+    assert second["curves"] == [{"iso": True, "psc": 25}, {"iso": False, "psc": 27}]
+
+
+def test_parse_loop():
+    values = np.array([508, 2, 0, 21, 1, 1, 1, 0, 23, 0, 21, 2, 0, 2, 1, 25, 0, 27])
+    edges, offsets, curves = geometry._parse_loop(values, 2)
+    assert edges.tolist() == [[0, 21, 1, 1, 1], [0, 21, 2, 0, 2]]
+    assert offsets.tolist() == [0, 1, 3]
+    assert curves.tolist() == [[0, 23], [1, 25], [0, 27]]
+
+    # every edge with one curve
+    values = np.array([508, 2, 0, 21, 1, 1, 1, 0, 23, 0, 21, 2, 0, 1, 1, 25])
+    edges, offsets, curves = geometry._parse_loop(values, 2)
+    assert edges.tolist() == [[0, 21, 1, 1, 1], [0, 21, 2, 0, 1]]
+    assert offsets.tolist() == [0, 1, 2]
+    assert curves.tolist() == [[0, 23], [1, 25]]
+    assert geometry._parse_uniform_loop(values, 2, 2) is None
+
+    edges, offsets, curves = geometry._parse_loop(np.array([508, 0]), 0)
+    assert edges.shape == (0, 5)
+    assert offsets.tolist() == [0]
+    assert curves.shape == (0, 2)
+
+
+def test_face_parse():
+    face = geometry.Face(None)
+    face._add_parameters(["510", "31", "2", "1", "33", "35"])
+    assert face.surf_pointer == 31
+    assert face.outer_loop_flag is True
+    assert face.loop_pointers.tolist() == [33, 35]
+
+    face._add_parameters(["510", "31", "1", "0", "37"])
+    assert face.outer_loop_flag is False
+    assert face.loop_pointers.tolist() == [37]
+
+
+class PointerEcho:
+    """Stands in for an Iges object, resolving pointers to themselves"""
+
+    def from_pointer(self, ptr):
+        return int(ptr)
+
+    def from_pointers(self, ptrs):
+        return [int(ptr) for ptr in ptrs]
+
+
+def test_boundary_curves():
+    boundary = geometry.Boundary(PointerEcho())
+    parameters = ["141", "1", "2", "7", "2"]
+    parameters += ["11", "0", "2", "13", "15", "17", "1", "1", "19"]
+    boundary._add_parameters(parameters)
+    assert boundary.get_space_curves() == [11, 17]
+    assert boundary.get_model_curves() == [[13, 15], [19]]
+
+
+def test_bounded_surface_parse():
+    bounded = geometry.Bounded_Surface(PointerEcho())
+    bounded._add_parameters(["143", "1", "41", "2", "43", "45"])
+    assert bounded.surface_pointer == 41
+    assert bounded.B.dtype == np.int64
+    assert bounded.get_boundaries() == [43, 45]
+
+
+def test_read_bounded_surface(tmp_path):
+    def line(data, section, number):
+        return f"{data:<72}{section}{number:7d}\n"
+
+    def directory(type_number, parameter_pointer, number):
+        fields = [type_number, parameter_pointer, 0, 0, 0, 0, 0, 0]
+        first = "".join(f"{field:8d}" for field in fields) + "00000000"
+        second = "".join(f"{field:8d}" for field in [type_number, 0, 0, 1, 0])
+        return line(first, "D", number) + line(second, "D", number + 1)
+
+    def parameter(data, de_pointer, number):
+        return line(f"{data:<64}{de_pointer:8d}", "P", number)
+
+    iges_file = tmp_path / "bounded.igs"
+    iges_file.write_text(
+        line("", "S", 1)
+        + line(",,;", "G", 1)
+        + directory(141, 1, 1)
+        + directory(143, 2, 3)
+        + parameter("141,0,0,5,1,7,0,0;", 1, 1)
+        + parameter("143,0,5,1,1;", 3, 2)
+        + line("S0000001G0000001D0000004P0000002", "T", 1)
+    )
+
+    iges = pyiges.read(str(iges_file))
+    (boundary,) = iges.Boundaries()
+    (bounded,) = iges.Bounded_Surfaces()
+    assert boundary.space_curves == [7]
+    assert bounded.surface_pointer == 5
+    assert bounded.get_boundaries() == [boundary]
+
+
+def test_face_loops_cached():
+    face = geometry.Face(PointerEcho())
+    face._add_parameters(["510", "31", "2", "1", "33", "35"])
+    assert face.loops == [33, 35]
+    assert face.loops is face.loops
+    assert not hasattr(face, "__dict__")
+
+
+def test_surface_of_revolution_parse():
+    surf = geometry.Surface_of_Revolution(None)
+    surf._add_parameters(["120", "3", "5", "0.0", "6.2831853D0"])
+    assert surf.axis_pointer == 3
+    assert surf.generatrix_pointer == 5
+    assert surf.start_angle == 0.0
+    assert surf.end_angle == pytest.approx(2 * np.pi)
+    assert repr(surf)
+
+    with pytest.raises(ValueError, match="Expected 4 parameters"):
+        surf._add_parameters(["120", "3", "5"])
+
+
+def test_tabulated_cylinder_parse():
+    cyl = geometry.Tabulated_Cylinder(None)
+    cyl._add_parameters(["122", "7", "1.0", "2.0", "-3.5"])
+    assert cyl.directrix_pointer == 7
+    assert (cyl.lx, cyl.ly, cyl.lz) == (1.0, 2.0, -3.5)
+    assert repr(cyl)
+
+
+@pytest.mark.parametrize(
+    "coefficients, kind",
+    [
+        (["1", "0", "1", "0", "0", "-1"], geometry.ConicArc.ELLIPSE),
+        (["1", "0", "-1", "0", "0", "-1"], geometry.ConicArc.HYPERBOLA),
+        (["0", "0", "1", "-1", "0", "0"], geometry.ConicArc.PARABOLA),
+    ],
+)
+def test_conic_arc_kind(coefficients, kind):
+    arc = geometry.ConicArc(None)
+    arc._add_parameters(["104"] + coefficients + ["1", "0", "0", "0", "1", "0"])
+    assert arc.conic_kind == kind
+    assert arc.a == float(coefficients[0])
+    assert arc.f == float(coefficients[5])
+    assert repr(arc)
+
+
 def test_example_with_invalid_conic_arc_and_form1_global_line():
     # For this file, the conic arc cannot be parsed.
     # This is either because of a wrong format of the file or a bug in the parsing.
@@ -696,6 +983,20 @@ def test_example_with_invalid_conic_arc_and_form1_global_line():
     assert len(iges.circular_arcs()) == 1
 
 
+def test_from_pointers(impeller):
+    composite = impeller.Composite_Curves()[0]
+    curves = impeller.from_pointers(composite.curves)
+    assert curves == [impeller.from_pointer(ptr) for ptr in composite.curves]
+    assert impeller.from_pointers([]) == []
+
+
+def test_from_pointer_after_discard():
+    iges = pyiges.read(os.path.join(DIR_TESTS_REFERENCE_DATA, "example-arcs.iges"))
+    for entity in iges:
+        assert iges.from_pointer(entity.sequence_number) is entity
+        assert iges[entity.sequence_number] is entity
+
+
 @adjust_depending_on_package_variant
 def test_to_vtk(impeller):
     lines = impeller.to_vtk(lines=True, bsplines=False, surfaces=False)